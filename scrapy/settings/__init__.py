@@ -3,8 +3,10 @@ from __future__ import annotations
 import copy
 import json
 from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from functools import partial
 from importlib import import_module
 from pprint import pformat
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, Union, cast
 
 from scrapy.settings import default_settings
@@ -14,7 +16,7 @@ from scrapy.settings import default_settings
 _SettingsKeyT = Union[bool, float, int, str, None]
 
 if TYPE_CHECKING:
-    from types import ModuleType
+    from collections.abc import Callable
 
     # https://github.com/python/typing/issues/445#issuecomment-1131458824
     from _typeshed import SupportsItems
@@ -34,6 +36,9 @@ SETTINGS_PRIORITIES: dict[str, int] = {
     "cmdline": 40,
 }
 
+_TRUE_STRINGS = frozenset(("1", "True", "true"))
+_FALSE_STRINGS = frozenset(("0", "False", "false"))
+
 
 def get_settings_priority(priority: int | str) -> int:
     """
@@ -53,6 +58,8 @@ class SettingsAttribute:
     for settings configuration, not this one.
     """
 
+    __slots__ = ("priority", "value")
+
     def __init__(self, value: Any, priority: int):
         self.value: Any = value
         self.priority: int
@@ -69,6 +76,15 @@ class SettingsAttribute:
             self.value = value
             self.priority = priority
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        # Skip __init__() to keep the priority as is, it may be lower than
+        # the current max priority of a BaseSettings value
+        attribute = self.__class__.__new__(self.__class__)
+        memo[id(self)] = attribute
+        attribute.value = copy.deepcopy(self.value, memo)
+        attribute.priority = self.priority
+        return attribute
+
     def __repr__(self) -> str:
         return f"<SettingsAttribute value={self.value!r} priority={self.priority}>"
 
@@ -104,9 +120,10 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
             self.update(values, priority)
 
     def __getitem__(self, opt_name: _SettingsKeyT) -> Any:
-        if opt_name not in self:
+        attribute = self.attributes.get(opt_name)
+        if attribute is None:
             return None
-        return self.attributes[opt_name].value
+        return attribute.value
 
     def __contains__(self, name: Any) -> bool:
         return name in self.attributes
@@ -121,7 +138,8 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
         :param default: the value to return if no setting is found
         :type default: object
         """
-        return self[name] if self[name] is not None else default
+        value = self[name]
+        return value if value is not None else default
 
     def getbool(self, name: _SettingsKeyT, default: bool = False) -> bool:
         """
@@ -140,13 +158,15 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
         :type default: object
         """
         got = self.get(name, default)
+        if got is True or got is False:
+            return got
+        if got in _TRUE_STRINGS:
+            return True
+        if got in _FALSE_STRINGS:
+            return False
         try:
             return bool(int(got))
         except ValueError:
-            if got in ("True", "true"):
-                return True
-            if got in ("False", "false"):
-                return False
             raise ValueError(
                 "Supported values for boolean settings "
                 "are 0/1, True/False, '0'/'1', "
@@ -217,6 +237,8 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
         :type default: object
         """
         value = self.get(name, default or {})
+        if isinstance(value, BaseSettings):
+            return {k: attribute.value for k, attribute in value.attributes.items()}
         if isinstance(value, str):
             value = json.loads(value)
         return dict(value)
@@ -284,9 +306,10 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
         :param name: the setting name
         :type name: str
         """
-        if name not in self:
+        attribute = self.attributes.get(name)
+        if attribute is None:
             return None
-        return self.attributes[name].priority
+        return attribute.priority
 
     def maxpriority(self) -> int:
         """
@@ -322,15 +345,19 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
             :attr:`~scrapy.settings.SETTINGS_PRIORITIES` or an integer
         :type priority: str or int
         """
-        self._assert_mutability()
-        priority = get_settings_priority(priority)
-        if name not in self:
+        # Keep this message in sync with _assert_mutability()
+        if self.frozen:
+            raise TypeError("Trying to modify an immutable Settings object")
+        if type(priority) is not int:
+            priority = get_settings_priority(priority)
+        attribute = self.attributes.get(name)
+        if attribute is None:
             if isinstance(value, SettingsAttribute):
                 self.attributes[name] = value
             else:
                 self.attributes[name] = SettingsAttribute(value, priority)
         else:
-            self.attributes[name].set(value, priority)
+            attribute.set(value, priority)
 
     def setdefault(
         self,
@@ -338,11 +365,12 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
         default: Any = None,
         priority: int | str = "project",
     ) -> Any:
-        if name not in self:
+        attribute = self.attributes.get(name)
+        if attribute is None:
             self.set(name, default, priority)
             return default
 
-        return self.attributes[name].value
+        return attribute.value
 
     def setdict(self, values: _SettingsInputT, priority: int | str = "project") -> None:
         self.update(values, priority)
@@ -367,9 +395,20 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
         self._assert_mutability()
         if isinstance(module, str):
             module = import_module(module)
-        for key in dir(module):
+        # A PEP 562 __getattr__() or __dir__() may add or hide names, so such
+        # modules go through dir() and getattr() like any other object
+        get_value: Callable[[str], Any]
+        namespace = vars(module) if type(module) is ModuleType else {}
+        if namespace and "__getattr__" not in namespace and "__dir__" not in namespace:
+            names: Iterable[str] = namespace
+            get_value = namespace.__getitem__
+        else:
+            names = dir(module)
+            get_value = partial(getattr, module)
+        set_ = self.set
+        for key in names:
             if key.isupper():
-                self.set(key, getattr(module, key), priority)
+                set_(key, get_value(key), priority)
 
     # BaseSettings.update() doesn't support all inputs that MutableMapping.update() supports
     def update(self, values: _SettingsInputT, priority: int | str = "project") -> None:  # type: ignore[override]
@@ -398,19 +437,21 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
         if isinstance(values, str):
             values = cast(dict[_SettingsKeyT, Any], json.loads(values))
         if values is not None:
+            set_ = self.set
             if isinstance(values, BaseSettings):
-                for name, value in values.items():
-                    self.set(name, value, cast(int, values.getpriority(name)))
+                for name, attribute in values.attributes.items():
+                    set_(name, attribute.value, attribute.priority)
             else:
                 for name, value in values.items():
-                    self.set(name, value, priority)
+                    set_(name, value, priority)
 
     def delete(self, name: _SettingsKeyT, priority: int | str = "project") -> None:
-        if name not in self:
+        attribute = self.attributes.get(name)
+        if attribute is None:
             raise KeyError(name)
         self._assert_mutability()
         priority = get_settings_priority(priority)
-        if priority >= cast(int, self.getpriority(name)):
+        if priority >= attribute.priority:
             del self.attributes[name]
 
     def __delitem__(self, name: _SettingsKeyT) -> None:
@@ -459,12 +500,6 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
     def __len__(self) -> int:
         return len(self.attributes)
 
-    def _to_dict(self) -> dict[_SettingsKeyT, Any]:
-        return {
-            self._get_key(k): (v._to_dict() if isinstance(v, BaseSettings) else v)
-            for k, v in self.items()
-        }
-
     def _get_key(self, key_value: Any) -> _SettingsKeyT:
         return (
             key_value
@@ -485,8 +520,29 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
         This method can be useful for example for printing settings
         in Scrapy shell.
         """
-        settings = self.copy()
-        return settings._to_dict()
+        memo: dict[int, Any] = {}
+        result: dict[_SettingsKeyT, Any] = {}
+        # Each entry keeps the ids of the settings objects on its path, to
+        # detect settings that contain themselves
+        stack: list[tuple[BaseSettings, dict[_SettingsKeyT, Any], frozenset[int]]] = [
+            (self, result, frozenset((id(self),)))
+        ]
+        while stack:
+            settings, dst, path = stack.pop()
+            for name, attribute in settings.attributes.items():
+                key = self._get_key(name)
+                value = attribute.value
+                if isinstance(value, BaseSettings):
+                    if id(value) in path:
+                        raise ValueError(
+                            f"Cannot convert settings to a dict, setting {name!r} "
+                            f"refers back to an enclosing settings object"
+                        )
+                    dst[key] = {}
+                    stack.append((value, dst[key], path | {id(value)}))
+                else:
+                    dst[key] = copy.deepcopy(value, memo)
+        return result
 
     # https://ipython.readthedocs.io/en/stable/config/integrating.html#pretty-printing
     def _repr_pretty_(self, p: Any, cycle: bool) -> None:
@@ -496,14 +552,14 @@ class BaseSettings(MutableMapping[_SettingsKeyT, Any]):
             p.text(pformat(self.copy_to_dict()))
 
     def pop(self, name: _SettingsKeyT, default: Any = __default) -> Any:
-        try:
-            value = self.attributes[name].value
-        except KeyError:
+        attribute = self.attributes.get(name)
+        if attribute is None:
             if default is self.__default:
-                raise
+                raise KeyError(name)
             return default
-        self.__delitem__(name)
-        return value
+        self._assert_mutability()
+        del self.attributes[name]
+        return attribute.value
 
 
 class Settings(BaseSettings):
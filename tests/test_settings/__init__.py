@@ -1,4 +1,5 @@
 import unittest
+from types import ModuleType
 from unittest import mock
 
 import pytest
@@ -106,8 +107,8 @@ class BaseSettingsTest(unittest.TestCase):
     def test_set_calls_settings_attributes_methods_on_update(self):
         attr = SettingsAttribute("value", 10)
         with (
-            mock.patch.object(attr, "__setattr__") as mock_setattr,
-            mock.patch.object(attr, "set") as mock_set,
+            mock.patch.object(SettingsAttribute, "__setattr__") as mock_setattr,
+            mock.patch.object(SettingsAttribute, "set") as mock_set,
         ):
             self.settings.attributes = {"TEST_OPTION": attr}
 
@@ -154,6 +155,26 @@ class BaseSettingsTest(unittest.TestCase):
         self.assertNotIn("lowercase_var", self.settings.attributes)
         self.assertEqual(len(self.settings.attributes), 1)
 
+    def test_setmodule_module_getattr(self):
+        module = ModuleType("settings_module")
+        module.UPPERCASE_VAR = "value"
+        module.__dir__ = lambda: ["LAZY_VAR", "UPPERCASE_VAR"]
+        module.__getattr__ = lambda name: f"lazy {name}"
+
+        self.settings.setmodule(module, 10)
+        self.assertEqual(self.settings["UPPERCASE_VAR"], "value")
+        self.assertEqual(self.settings["LAZY_VAR"], "lazy LAZY_VAR")
+
+    def test_setmodule_module_dir(self):
+        module = ModuleType("settings_module")
+        module.UPPERCASE_VAR = "value"
+        module.HIDDEN_VAR = "hidden"
+        module.__dir__ = lambda: ["UPPERCASE_VAR"]
+
+        self.settings.setmodule(module, 10)
+        self.assertEqual(self.settings["UPPERCASE_VAR"], "value")
+        self.assertNotIn("HIDDEN_VAR", self.settings)
+
     def test_setmodule_alias(self):
         with mock.patch.object(self.settings, "set") as mock_set:
             self.settings.setmodule(default_settings, 10)
@@ -366,6 +387,14 @@ class BaseSettingsTest(unittest.TestCase):
             copy.get("TEST_LIST_OF_LISTS")[0], ["first_one", "first_two"]
         )
 
+    def test_copy_keeps_priorities(self):
+        self.settings.set("TEST_DICT", BaseSettings({"key": "val"}, 0), 10)
+        self.settings["TEST_DICT"].set("key", "newval", 30)
+        copy = self.settings.copy()
+        self.assertEqual(copy.getpriority("TEST_DICT"), 10)
+        self.assertEqual(copy["TEST_DICT"].getpriority("key"), 30)
+        self.assertIsNot(copy["TEST_DICT"], self.settings["TEST_DICT"])
+
     def test_copy_to_dict(self):
         s = BaseSettings(
             {
@@ -389,6 +418,25 @@ class BaseSettingsTest(unittest.TestCase):
             },
         )
 
+    def test_copy_to_dict_self_reference(self):
+        s = BaseSettings({"TEST": BaseSettings({"key": "val"})})
+        s["TEST"].set("PARENT", s)
+        with pytest.raises(
+            ValueError, match="refers back to an enclosing settings object"
+        ):
+            s.copy_to_dict()
+
+    def test_copy_to_dict_shared_settings(self):
+        shared = BaseSettings({"key": "val"})
+        s = BaseSettings({"A": shared, "B": shared})
+        self.assertEqual(s.copy_to_dict(), {"A": {"key": "val"}, "B": {"key": "val"}})
+
+    def test_copy_to_dict_is_deep(self):
+        s = BaseSettings({"TEST_BASE": BaseSettings({"list": [1, 2]})})
+        d = s.copy_to_dict()
+        d["TEST_BASE"]["list"].append(3)
+        self.assertEqual(s["TEST_BASE"]["list"], [1, 2])
+
     def test_freeze(self):
         self.settings.freeze()
         with pytest.raises(